@@ -30,11 +30,14 @@ import serial
 import time
 import traceback
 import ctypes
-import math
 
 __all__ = ['AVR']
 
 
+# Delay before retrying serial IO, indexed by consecutive error count
+_io_error_delays = tuple(0.1 * 2 ** max(6, n) for n in range(11))
+
+
 class _serial_struct(ctypes.Structure):
     _fields_ = [
         ('type',            ctypes.c_int),
@@ -74,6 +77,7 @@ def _serial_set_low_latency(sp):
 class AVR(object):
     def __init__(self, ctrl):
         self.ctrl     = ctrl
+        self.ioloop   = ctrl.ioloop
         self.log      = ctrl.log.get('AVR')
         self.sp       = None
         self.i2c_addr = ctrl.args.avr_addr
@@ -117,7 +121,7 @@ class AVR(object):
             self.sp.nonblocking()
             #_serial_set_low_latency(self.sp)
 
-            self.ctrl.ioloop.add_handler(self.sp, self._serial_handler, 0)
+            self.ioloop.add_handler(self.sp, self._serial_handler, 0)
             self.enable_read(True)
 
         except Exception as e:
@@ -140,23 +144,23 @@ class AVR(object):
         if enable: self.events |= events
         else: self.events &= ~events
 
-        self.ctrl.ioloop.update_handler(self.sp, self.events)
+        self.ioloop.update_handler(self.sp, self.events)
 
 
     def enable_write(self, enable):
-        self.update_events(self.ctrl.ioloop.WRITE, enable)
+        self.update_events(self.ioloop.WRITE, enable)
 
 
     def enable_read(self, enable):
-        self.update_events(self.ctrl.ioloop.READ, enable)
+        self.update_events(self.ioloop.READ, enable)
 
 
     def _serial_handler(self, fd, events):
         try:
-            if self.ctrl.ioloop.READ & events:
+            if self.ioloop.READ & events:
                 self.read_cb(self.sp.read(self.sp.in_waiting))
 
-            if self.ctrl.ioloop.WRITE & events:
+            if self.ioloop.WRITE & events:
                 self.write_cb(lambda data: self.sp.write(data))
 
             self.errors = 0
@@ -166,16 +170,17 @@ class AVR(object):
 
             # Delay next IO
             self.errors += 1
-            delay = 0.1 * math.pow(2, max(6, self.errors))
+            i = min(self.errors, len(_io_error_delays) - 1)
+            delay = _io_error_delays[i]
 
             events = self.events
             self.update_events(events, False)
 
-            self.ctrl.ioloop.call_later(delay, self.update_events, events, True)
+            self.ioloop.call_later(delay, self.update_events, events, True)
 
 
     def i2c_command(self, cmd, byte = None, word = None, block = None):
-        self.log.info('I2C: %s b=%s w=%s d=%s' % (cmd, byte, word, block))
+        self.log.info('I2C: %s b=%s w=%s d=%s', cmd, byte, word, block)
         retry = 10
         cmd = ord(cmd[0])
 
@@ -188,10 +193,10 @@ class AVR(object):
                 retry -= 1
 
                 if retry:
-                    self.log.warning('I2C failed, retrying: %s' % e)
+                    self.log.warning('I2C failed, retrying: %s', e)
                     time.sleep(0.25)
                     continue
 
                 else:
-                    self.log.error('I2C failed: %s' % e)
+                    self.log.error('I2C failed: %s', e)
                     raise
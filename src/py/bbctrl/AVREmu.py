@@ -52,12 +52,11 @@ class AVREmu(object):
         # Close pipes
         def _close(fd, withHandle):
             if fd is None: return
-            try:
-                if withHandle: self.ctrl.ioloop.remove_handler(fd)
-            except: pass
+            if withHandle and self.ctrl.ioloop.has_handler(fd):
+                self.ctrl.ioloop.remove_handler(fd)
             try:
                 os.close(fd)
-            except: pass
+            except OSError: pass
 
         _close(self.avrOut, True)
         _close(self.avrIn,  True)
@@ -80,7 +80,9 @@ class Comm(ABC):
         self.estopped = False
 
         avr.set_handlers(self._read, self._write)
-        self._poll_cb(False)
+
+        # Checks periodically for new commands from planner via comm_next()
+        ctrl.ioloop.call_periodic(1, self.flush)
 
         # Let simulations proceed after timeout
         ctrl.ioloop.call_later(10, self.ctrl.ready)
@@ -97,7 +99,7 @@ class Comm(ABC):
 
 
     def i2c_command(self, cmd, byte = None, word = None, block = None):
-        self.log.info('I2C: %s b=%s w=%s d=%s' % (cmd, byte, word, block))
+        self.log.info('I2C: %s b=%s w=%s d=%s', cmd, byte, word, block)
         self.avr.i2c_command(cmd, byte, word, block)
 
 
@@ -128,12 +130,6 @@ class Comm(ABC):
         self.flush()
 
 
-    def _poll_cb(self, now = True):
-        # Checks periodically for new commands from planner via comm_next()
-        if now: self.flush()
-        self.ctrl.ioloop.call_later(1, self._poll_cb)
-
-
     def _write(self, write_cb):
         # Finish writing current command
         if self.command is not None:
@@ -204,7 +200,7 @@ class Comm(ABC):
                 self.last_motor_flags[motor] = flags
 
                 flags = driver_flags_to_string(flags)
-                self.log.info('Motor %d flags: %s' % (motor, flags))
+                self.log.info('Motor %d flags: %s', motor, flags)
 
 
     def _update_state(self, update):
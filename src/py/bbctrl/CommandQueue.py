@@ -66,7 +66,7 @@ class CommandQueue():
             # Execute commands <= releaseID
             if util.id16_less(self.releaseID, id): return
 
-            self.log.info('releasing id=%d' % id)
+            self.log.info('releasing id=%d', id)
             self.q.popleft()
 
             try:
@@ -78,7 +78,7 @@ class CommandQueue():
 
     def release(self, id):
         if id and not util.id16_less(self.releaseID, id):
-            self.log.debug('id out of order %d <= %d' % (id, self.releaseID))
+            self.log.debug('id out of order %d <= %d', id, self.releaseID)
         self.releaseID = id
 
         self._release()
@@ -56,12 +56,14 @@ class IOLoop(object):
         self.fds = set()
         self.handles = set()
         self.callbacks = {}
+        self.periodics = set()
 
 
     def close(self):
         for fd in list(self.fds): self.ioloop.remove_handler(fd)
         for h in list(self.handles): self.ioloop.remove_timeout(h)
         for h in list(self.callbacks): self.ioloop.remove_timeout(h)
+        for pc in list(self.periodics): pc.stop()
 
 
     def add_handler(self, fd, handler, events):
@@ -76,6 +78,11 @@ class IOLoop(object):
         self.fds.remove(h)
 
 
+    def has_handler(self, fd):
+        if hasattr(fd, 'fileno'): fd = fd.fileno()
+        return fd in self.fds
+
+
     def update_handler(self, fd, events): self.ioloop.update_handler(fd, events)
 
 
@@ -90,6 +97,18 @@ class IOLoop(object):
         if h in self.callbacks: del self.callbacks[h]
 
 
+    def call_periodic(self, period, callback):
+        pc = tornado.ioloop.PeriodicCallback(callback, period * 1000)
+        self.periodics.add(pc)
+        pc.start()
+        return pc
+
+
+    def remove_periodic(self, pc):
+        pc.stop()
+        self.periodics.discard(pc)
+
+
     def add_callback(self, cb, *args, **kwargs):
         self.ioloop.add_callback(cb, *args, **kwargs)
 
@@ -56,7 +56,7 @@ class Jog(inevent.JogHandler):
 
         self.v = [0.0] * 4
         self.lastV = self.v
-        self.update()
+        self.timer = None
 
         self.processor = inevent.InEvent(
             ctrl.ioloop, ctrl.udevev, self, types = ['js'],
@@ -98,6 +98,8 @@ class Jog(inevent.JogHandler):
 
 
     def update(self):
+        self.timer = None
+
         if self.v != self.lastV:
             self.lastV = self.v
             try:
@@ -108,8 +110,6 @@ class Jog(inevent.JogHandler):
             except Exception as e:
                 self.log.warning('Jog: %s', e)
 
-        self.ctrl.ioloop.call_later(0.25, self.update)
-
 
     def changed(self):
         scale = 1.0
@@ -118,3 +118,7 @@ class Jog(inevent.JogHandler):
         if self.speed == 3: scale = 1.0 / 4.0
 
         self.v = [x * scale for x in self.axes]
+
+        # Rate limit jog updates, only polls while the joystick is changing
+        if self.timer is None:
+            self.timer = self.ctrl.ioloop.call_later(0.25, self.update)
@@ -58,7 +58,7 @@ class MonitorTemp(object):
         self.log = self.ctrl.log.get('Mon')
         self.ioloop = self.ctrl.ioloop
 
-        self.last_temp_warn = 0
+        self.last_temp_warn = float('-inf') # Never warned
         self.temp_thresh = 80
         self.min_temp = 60
         self.max_temp = 80
@@ -93,10 +93,11 @@ class MonitorTemp(object):
 
     def log_warnings(self, temp):
         # Reset temperature warning threshold after timeout
-        if time.time() < self.last_temp_warn + 60: self.temp_thresh = 80
+        now = time.monotonic()
+        if now < self.last_temp_warn + 60: self.temp_thresh = 80
 
         if self.temp_thresh < temp:
-            self.last_temp_warn = time.time()
+            self.last_temp_warn = now
             self.temp_thresh = temp
 
             self.log.info('Hot RaspberryPi at %d°C' % temp)
@@ -204,7 +204,7 @@ class Planner():
         state = self.ctrl.state.get('xx', '')
 
         if state in ('STOPPING', 'RUNNING') and self.move_start:
-            delta = time.time() - self.move_start
+            delta = time.monotonic() - self.move_start
             if self.move_time < delta: delta = self.move_time
             plan_time = self.current_plan_time + delta
 
@@ -222,7 +222,7 @@ class Planner():
     def _update_time(self, plan_time, move_time):
         self.current_plan_time = plan_time
         self.move_time = move_time
-        self.move_start = time.time()
+        self.move_start = time.monotonic()
 
 
     def _enqueue_line_time(self, block):
@@ -192,8 +192,9 @@ class Plan(object):
 
 
     def progress(self, x):
-        if time.time() - self.lastProgressTime < 1 and x != 1: return
-        self.lastProgressTime = time.time()
+        now = time.monotonic()
+        if now - self.lastProgressTime < 1 and x != 1: return
+        self.lastProgressTime = now
 
         p = '%.4f\n' % x
 
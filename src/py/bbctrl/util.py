@@ -29,10 +29,12 @@ from datetime import datetime
 import pkg_resources
 from pkg_resources import Requirement, resource_filename
 import socket
-from .version import Version
+from . import version
 
 
 _version = pkg_resources.require('bbctrl')[0].version.strip('\'"')
+_now = datetime.now
+_ts_fmt = '%Y%m%d-%H%M%S'
 
 try:
   with open('/sys/firmware/devicetree/base/model', 'r') as f:
@@ -50,13 +52,13 @@ def get_resource(path):
 
 def get_version(): return _version
 def get_model(): return _model
-def parse_version(s): return Version(s)
-def version_less(a, b): return Version(a) < Version(b)
-def timestamp(): return datetime.now().strftime('%Y%m%d-%H%M%S')
+def parse_version(s): return version.parse_version(s)
+def version_less(a, b): return version.version_less(a, b)
+def timestamp(): return _now().strftime(_ts_fmt)
 
 
 def get_config_filename():
-  return socket.gethostname() + datetime.now().strftime('-%Y%m%d-%H%M%S.json')
+  return socket.gethostname() + '-' + timestamp() + '.json'
 
 
 def timestamp_to_iso8601(ts):
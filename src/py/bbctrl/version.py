@@ -26,7 +26,28 @@
 ################################################################################
 
 import re
-from typing import Optional, Tuple, List, Union
+import enum
+import functools
+from typing import Optional, List, Union
+
+
+# Regex pattern for PEP 440 validation
+_PEP440_RE = re.compile(
+    r'^(\d+)\.(\d+)\.(\d+)'  # MAJOR.MINOR.PATCH
+    r'((?:a|b|rc)\d+|'  # PRERELEASE: aN, bN, rcN
+    r'\.dev\d+)?'  # or .devN
+    r'(\+([a-zA-Z0-9]+(?:[.-]+[a-zA-Z0-9]+)*))?'  # [+BUILD]
+    r'$', re.ASCII
+)
+
+
+class Stage(enum.IntEnum):
+    """Release stages, in PRERELEASE_IDENTIFIERS order after FINAL."""
+    FINAL   = 0
+    DEV     = 1
+    ALPHA   = 2
+    BETA    = 3
+    RC      = 4
 
 
 class Version:
@@ -35,19 +56,28 @@ class Version:
 
     Format: MAJOR.MINOR.PATCH[PRERELEASE][+BUILD]
     Pre-release identifiers: a (alpha), b (beta), rc (release candidate), .dev (development)
+
+    Instances are treated as immutable so that parsed results may be cached
+    and shared.  Do not assign to their attributes.
     """
 
+    __slots__ = ('_version_string', 'major', 'minor', 'patch', 'prerelease',
+                 'build', '_cmp_key', '_stage', '_pre_id', '_pre_num',
+                 '__weakref__')
+
     # Valid pre-release identifiers in order of precedence (lowest to highest)
-    PRERELEASE_IDENTIFIERS = ['dev', 'a', 'b', 'rc']
+    PRERELEASE_IDENTIFIERS = ('dev', 'a', 'b', 'rc')
+    _PRERELEASE_INDEX = {
+        identifier: i for i, identifier in enumerate(PRERELEASE_IDENTIFIERS)}
+
+    # Stage names indexed by Stage
+    _STAGES = ('final', 'development', 'alpha', 'beta', 'release-candidate')
+
+    # Internal prerelease forms accepted by _from_parts()
+    _PRERELEASE_SPLIT = re.compile(r'^(dev|a|b|rc)\d+$', re.ASCII)
 
     # Regex pattern for PEP 440 validation
-    PEP440_PATTERN = re.compile(
-        r'^(\d+)\.(\d+)\.(\d+)'  # MAJOR.MINOR.PATCH
-        r'((?:a|b|rc)\d+|'  # PRERELEASE: aN, bN, rcN
-        r'\.dev\d+)?'  # or .devN
-        r'(\+([a-zA-Z0-9](?:[a-zA-Z0-9.-]*[a-zA-Z0-9])?))?'  # [+BUILD]
-        r'$'
-    )
+    PEP440_PATTERN = _PEP440_RE
 
     def __init__(self, version_string: str):
         """
@@ -59,87 +89,116 @@ class Version:
         Raises:
             ValueError: If version string is invalid
         """
-        self.version_string = version_string
-        self.major, self.minor, self.patch = 0, 0, 0
-        self.prerelease: Optional[str] = None
-        self.build: Optional[str] = None
-
+        self._version_string = version_string
         self._parse(version_string)
 
     def _parse(self, version_string: str) -> None:
         """Parse version string and validate format."""
-        match = self.PEP440_PATTERN.match(version_string)
+        match = _PEP440_RE.match(version_string)
         if not match:
             raise ValueError(f"Invalid PEP 440 version format: {version_string}")
 
-        self.major = int(match.group(1))
-        self.minor = int(match.group(2))
-        self.patch = int(match.group(3))
+        # The pattern only accepts aN, bN, rcN and .devN prereleases
+        major, minor, patch, prerelease, _, build = match.groups()
 
-        if match.group(4):  # Has prerelease
-            prerelease = match.group(4)
-            # Convert .dev format to dev format for internal storage
-            if prerelease.startswith('.dev'):
-                self.prerelease = prerelease[1:]  # Remove leading dot
-            else:
-                self.prerelease = prerelease
+        # Convert .dev format to dev format for internal storage
+        if prerelease and prerelease[0] == '.': prerelease = prerelease[1:]
 
-        if match.group(6):  # Has build metadata
-            self.build = match.group(6)
+        self._set_parts(int(major), int(minor), int(patch), prerelease, build)
 
-        self._validate_prerelease()
+    def _set_parts(self, major: int, minor: int, patch: int,
+                   prerelease: Optional[str], build: Optional[str]) -> None:
+        """Set version components and the values derived from them."""
+        self.major, self.minor, self.patch = major, minor, patch
+        self.prerelease = prerelease
+        self.build = build
 
-    def _validate_prerelease(self) -> None:
-        """Validate prerelease identifier format according to PEP 440."""
-        if not self.prerelease:
-            return
-
-        # PEP 440 prerelease format validation
-        if self.prerelease.startswith('dev'):
-            # devN format
-            if len(self.prerelease) > 3 and self.prerelease[3:].isdigit():
-                return
-            elif self.prerelease == 'dev':
-                return
-        elif self.prerelease.startswith(('a', 'b', 'rc')):
-            # aN, bN, rcN format
-            if self.prerelease.startswith('rc'):
-                identifier = 'rc'
-            else:
-                identifier = self.prerelease[0]
-            if identifier in self.PRERELEASE_IDENTIFIERS:
-                remaining = self.prerelease[len(identifier):]
-                if remaining.isdigit() or not remaining:
-                    return
-
-        raise ValueError(f"Invalid PEP 440 prerelease identifier: {self.prerelease}")
+        if prerelease is None:
+            self._pre_id, self._pre_num = None, 0
+            self._stage = 0  # Stage.FINAL
+            prerelease_key = (1,)  # Final releases sort after prereleases
+
+        else:
+            # Prereleases are always aN, bN, rcN or devN once validated
+            self._pre_id = prerelease.rstrip('0123456789')
+            self._pre_num = int(prerelease[len(self._pre_id):])
+            index = self._PRERELEASE_INDEX[self._pre_id]
+
+            # Stages follow PRERELEASE_IDENTIFIERS order, after FINAL
+            self._stage = index + 1
+            prerelease_key = (0, index, self._pre_num)
+
+        # Build metadata is ignored for version comparison
+        self._cmp_key = (major, minor, patch, prerelease_key)
 
     @classmethod
     def parse(cls, version_string: str) -> 'Version':
-        """Parse version string and return Version object."""
+        """Parse version string and return a shared Version object."""
+        if cls is Version: return _get_version(version_string)
         return cls(version_string)
 
     @classmethod
     def is_valid(cls, version_string: str) -> bool:
         """Check if version string is valid PEP 440 format."""
-        try:
-            cls(version_string)
-            return True
-        except ValueError:
-            return False
+        return _match_only(version_string)
+
+    @classmethod
+    def sort_many(cls, version_strings: List[str]) -> List[str]:
+        """
+        Sort version strings in ascending version order.
+
+        Each string is parsed once, without going through the parse() cache,
+        and sorted on its comparison key so that no Python level comparisons
+        are made.
+        """
+        return sorted(version_strings, key = lambda s: cls(s)._cmp_key)
+
+    @classmethod
+    def _from_parts(cls, major: int, minor: int, patch: int,
+                    prerelease: Optional[str] = None,
+                    build: Optional[str] = None) -> 'Version':
+        """
+        Build a Version from already validated components.
+
+        Skips parsing and prerelease validation.
+        """
+        assert prerelease is None or cls._PRERELEASE_SPLIT.match(prerelease)
+
+        version = cls.__new__(cls)
+        version._version_string = None  # Formatted on first use
+        version._set_parts(major, minor, patch, prerelease, build)
+
+        return version
+
+    @property
+    def version_string(self) -> str:
+        """Version string this object was parsed from or formatted to."""
+        if self._version_string is None:
+            self._version_string = self._format()
+        return self._version_string
+
+    @property
+    def key(self) -> tuple:
+        """
+        Sort key which orders versions like the comparison operators.
+
+        Sorting with key = operator.attrgetter('key') uses C-level tuple
+        comparisons instead of calling Version.__lt__ for each pair.
+        """
+        return self._cmp_key
+
+    def _format(self) -> str:
+        """Format the version components in PEP 440 format."""
+        # Format prerelease according to PEP 440, devN is written .devN
+        pre = self.prerelease or ''
+        if self.is_development(): pre = '.' + pre
+        build = '+' + self.build if self.build else ''
+
+        return f"{self.major}.{self.minor}.{self.patch}{pre}{build}"
 
     def __str__(self) -> str:
         """Return version string in PEP 440 format."""
-        base = f"{self.major}.{self.minor}.{self.patch}"
-        if self.prerelease:
-            # Format prerelease according to PEP 440
-            if self.prerelease.startswith('dev'):
-                base += f".{self.prerelease}"
-            else:
-                base += self.prerelease
-        if self.build:
-            base += f"+{self.build}"
-        return base
+        return self._format()
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -151,21 +210,38 @@ class Version:
             return NotImplemented
         return self.version_string == other.version_string
 
+    def __hash__(self) -> int:
+        """Hash consistently with __eq__.  Relies on Version being immutable."""
+        # Equal version strings always have equal keys.  Hashing the key
+        # avoids formatting version_string for versions built from parts.
+        return hash(self._cmp_key)
+
     def __lt__(self, other: 'Version') -> bool:
         """Compare versions for less than."""
-        return self._compare(other) < 0
+        return self._cmp_key < other._cmp_key
 
     def __le__(self, other: 'Version') -> bool:
         """Compare versions for less than or equal."""
-        return self._compare(other) <= 0
+        return self._cmp_key <= other._cmp_key
 
     def __gt__(self, other: 'Version') -> bool:
         """Compare versions for greater than."""
-        return self._compare(other) > 0
+        return self._cmp_key > other._cmp_key
 
     def __ge__(self, other: 'Version') -> bool:
         """Compare versions for greater than or equal."""
-        return self._compare(other) >= 0
+        return self._cmp_key >= other._cmp_key
+
+    def compare_to(self, other: Union[str, 'Version']) -> int:
+        """
+        Compare this version with another version or version string.
+
+        Returns:
+            -1 if self < other
+             0 if self == other
+             1 if self > other
+        """
+        return self._compare(_as_version(other))
 
     def _compare(self, other: 'Version') -> int:
         """
@@ -176,73 +252,9 @@ class Version:
              0 if self == other
              1 if self > other
         """
-        # Compare major.minor.patch
-        for self_part, other_part in [(self.major, other.major),
-                                     (self.minor, other.minor),
-                                     (self.patch, other.patch)]:
-            if self_part != other_part:
-                return (self_part > other_part) - (self_part < other_part)
-
-        # Compare prerelease
-        if self.prerelease and not other.prerelease:
-            return -1  # Prerelease < final release
-        elif not self.prerelease and other.prerelease:
-            return 1   # Final release > prerelease
-        elif self.prerelease and other.prerelease:
-            prerelease_cmp = self._compare_prerelease(other.prerelease)
-            if prerelease_cmp != 0:
-                return prerelease_cmp
-
-        # PEP 440 doesn't specify ordering for build metadata
-        # Build metadata is ignored for version comparison
-        return 0  # Equal
-
-    def _compare_prerelease(self, other_prerelease: str) -> int:
-        """Compare prerelease identifiers."""
-        self_parts = self.prerelease.split('.')
-        other_parts = other_prerelease.split('.')
-
-        # Extract base identifier and numeric part for each
-        def parse_identifier_part(part: str) -> tuple[str, int]:
-            for identifier in self.PRERELEASE_IDENTIFIERS:
-                if part.startswith(identifier):
-                    remaining = part[len(identifier):]
-                    if remaining.isdigit():
-                        return identifier, int(remaining)
-                    elif not remaining:
-                        return identifier, 0
-            # If no match, treat as unknown identifier with precedence after all known ones
-            return part, 0
-
-        self_base, self_num = parse_identifier_part(self_parts[0])
-        other_base, other_num = parse_identifier_part(other_parts[0])
-
-        # Compare identifier precedence
-        try:
-            self_idx = self.PRERELEASE_IDENTIFIERS.index(self_base)
-        except ValueError:
-            self_idx = len(self.PRERELEASE_IDENTIFIERS)  # Unknown identifiers come last
-
-        try:
-            other_idx = self.PRERELEASE_IDENTIFIERS.index(other_base)
-        except ValueError:
-            other_idx = len(self.PRERELEASE_IDENTIFIERS)  # Unknown identifiers come last
-
-        if self_idx != other_idx:
-            return (self_idx > other_idx) - (self_idx < other_idx)
-
-        # Same identifier type, compare numeric parts
-        if self_num != other_num:
-            return (self_num > other_num) - (self_num < other_num)
-
-        # If we have more parts, compare them lexicographically
-        self_remaining = '.'.join(self_parts[1:])
-        other_remaining = '.'.join(other_parts[1:])
-
-        if self_remaining != other_remaining:
-            return (self_remaining > other_remaining) - (self_remaining < other_remaining)
-
-        return 0
+        a, b = self._cmp_key, other._cmp_key
+        if a == b: return 0
+        return -1 if a < b else 1
 
     def is_prerelease(self) -> bool:
         """Check if this is a prerelease version."""
@@ -250,106 +262,97 @@ class Version:
 
     def is_development(self) -> bool:
         """Check if this is a development release."""
-        return self.prerelease and self.prerelease.startswith('dev')
+        return self._stage == Stage.DEV
 
     def is_alpha(self) -> bool:
         """Check if this is an alpha release."""
-        return self.prerelease and self.prerelease.startswith('a')
+        return self._stage == Stage.ALPHA
 
     def is_beta(self) -> bool:
         """Check if this is a beta release."""
-        return self.prerelease and self.prerelease.startswith('b')
+        return self._stage == Stage.BETA
 
     def is_release_candidate(self) -> bool:
         """Check if this is a release candidate."""
-        return self.prerelease and self.prerelease.startswith('rc')
+        return self._stage == Stage.RC
 
     def get_stage(self) -> str:
         """Get the development stage of this version."""
-        if not self.is_prerelease():
-            return 'final'
-        elif self.is_development():
-            return 'development'
-        elif self.is_alpha():
-            return 'alpha'
-        elif self.is_beta():
-            return 'beta'
-        elif self.is_release_candidate():
-            return 'release-candidate'
-        else:
-            return 'unknown'
+        return self._STAGES[self._stage]
 
     def bump_major(self) -> 'Version':
         """Return new version with major bumped."""
-        return Version(f"{self.major + 1}.0.0")
+        return Version._from_parts(self.major + 1, 0, 0)
 
     def bump_minor(self) -> 'Version':
         """Return new version with minor bumped."""
-        return Version(f"{self.major}.{self.minor + 1}.0")
+        return Version._from_parts(self.major, self.minor + 1, 0)
 
     def bump_patch(self) -> 'Version':
         """Return new version with patch bumped."""
-        return Version(f"{self.major}.{self.minor}.{self.patch + 1}")
+        return Version._from_parts(self.major, self.minor, self.patch + 1)
 
     def bump_prerelease(self) -> 'Version':
         """Return new version with prerelease bumped."""
         if not self.prerelease:
             raise ValueError("Cannot bump prerelease on final version")
 
-        # Handle different PEP 440 prerelease formats
-        if self.prerelease.startswith('dev'):
-            # devN format
-            if self.prerelease == 'dev':
-                return Version(f"{self.major}.{self.minor}.{self.patch}.dev1")
-            else:
-                num = int(self.prerelease[3:]) + 1
-                return Version(f"{self.major}.{self.minor}.{self.patch}.dev{num}")
-        elif self.prerelease.startswith(('a', 'b', 'rc')):
-            # aN, bN, rcN format
-            if self.prerelease.startswith('rc'):
-                identifier = 'rc'
-                remaining = self.prerelease[2:]
-            else:
-                identifier = self.prerelease[0]
-                remaining = self.prerelease[1:]
-
-            if remaining.isdigit():
-                num = int(remaining) + 1
-                return Version(f"{self.major}.{self.minor}.{self.patch}{identifier}{num}")
-            else:
-                return Version(f"{self.major}.{self.minor}.{self.patch}{identifier}1")
-
-        # If no known identifier found, append 1
-        return Version(f"{self.major}.{self.minor}.{self.patch}{self.prerelease}1")
+        return Version._from_parts(self.major, self.minor, self.patch,
+                                   f"{self._pre_id}{self._pre_num + 1}")
 
     def to_final(self) -> 'Version':
         """Return final version (without prerelease)."""
-        return Version(f"{self.major}.{self.minor}.{self.patch}")
+        return Version._from_parts(self.major, self.minor, self.patch)
 
     def next_stage(self) -> 'Version':
         """Move to next development stage."""
+        major, minor, patch = self.major, self.minor, self.patch
+
         if self.is_development():
-            return Version(f"{self.major}.{self.minor}.{self.patch}a1")
+            return Version._from_parts(major, minor, patch, 'a1')
         elif self.is_alpha():
-            return Version(f"{self.major}.{self.minor}.{self.patch}b1")
+            return Version._from_parts(major, minor, patch, 'b1')
         elif self.is_beta():
-            return Version(f"{self.major}.{self.minor}.{self.patch}rc1")
+            return Version._from_parts(major, minor, patch, 'rc1')
         elif self.is_release_candidate():
-            return Version(f"{self.major}.{self.minor}.{self.patch}")
+            return Version._from_parts(major, minor, patch)
         else:
             # Final version - bump minor for next development cycle
-            return Version(f"{self.major}.{self.minor + 1}.0.dev1")
+            return Version._from_parts(major, minor + 1, 0, 'dev1')
 
     def with_build(self, build: str) -> 'Version':
         """Return version with build metadata."""
-        base = f"{self.major}.{self.minor}.{self.patch}"
-        if self.prerelease:
-            # Format prerelease according to PEP 440
-            if self.prerelease.startswith('dev'):
-                base += f".{self.prerelease}"
-            else:
-                base += self.prerelease
-        return Version(f"{base}+{build}")
+        if not _is_valid_build(build):
+            raise ValueError(f"Invalid PEP 440 build metadata: {build}")
+
+        return Version._from_parts(
+            self.major, self.minor, self.patch, self.prerelease, build)
+
+
+_BUILD_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
+
+
+@functools.lru_cache(maxsize = 2048)
+def _get_version(version_string: str) -> Version:
+    """Construct a Version, caching it for Version.parse()."""
+    return Version(version_string)
+
+
+def _match_only(version_string: str) -> bool:
+    """Check the version format without building a Version."""
+    return _PEP440_RE.match(version_string) is not None
+
+
+def _is_valid_build(build: str) -> bool:
+    """Check build metadata against the PEP440_PATTERN build group."""
+    return (bool(build) and build.isascii() and build[0].isalnum() and
+            build[-1].isalnum() and _BUILD_CHARS.issuperset(build))
+
+
+def _as_version(version: Union[str, Version]) -> Version:
+    """Return version as a Version, parsing it only if it is a string."""
+    return version if isinstance(version, Version) else Version.parse(version)
 
 
 def parse_version(version_string: str) -> Version:
@@ -357,23 +360,33 @@ def parse_version(version_string: str) -> Version:
     return Version.parse(version_string)
 
 
-def compare_versions(version1: str, version2: str) -> int:
+@functools.lru_cache(maxsize = 8192)
+def _compare_strings(version1: str, version2: str) -> int:
+    """Compare two version strings, caching the result."""
+    return Version.parse(version1)._compare(Version.parse(version2))
+
+
+def compare_versions(version1: Union[str, Version],
+                     version2: Union[str, Version]) -> int:
     """
-    Compare two version strings.
+    Compare two versions or version strings.
 
     Returns:
         -1 if version1 < version2
          0 if version1 == version2
          1 if version1 > version2
     """
-    v1 = Version(version1)
-    v2 = Version(version2)
-    return v1._compare(v2)
+    if isinstance(version1, str) and isinstance(version2, str):
+        return _compare_strings(version1, version2)
+
+    return _as_version(version1)._compare(_as_version(version2))
 
 
-def version_less(version1: str, version2: str) -> bool:
+def version_less(version1: Union[str, Version],
+                 version2: Union[str, Version]) -> bool:
     """Check if version1 is less than version2."""
     return compare_versions(version1, version2) < 0
 
 
-__all__ = ['Version', 'parse_version', 'compare_versions', 'version_less']
\ No newline at end of file
+__all__ = ['Version', 'Stage', 'parse_version', 'compare_versions',
+           'version_less']
\ No newline at end of file